@@ -151,18 +151,16 @@ def generate_sample_chart_metadata() -> Dict[str, Any]:
     for indicator, dataset_info in datasets.items():
         data = dataset_info["data"]
         
-        # Calculate histogram
+        # Calculate histogram (bin centers are derivable from edges; not shipped)
         hist, bin_edges = np.histogram(data, bins=30, density=False)
-        bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
         
         # Calculate percentiles
         p10, p50, p90 = np.percentile(data, [10, 50, 90])
         
         chart_metadata[indicator] = {
             "bins": {
-                "centers": [float(x) for x in bin_centers],
-                "counts": [int(x) for x in hist],
-                "edges": [float(x) for x in bin_edges]
+                "counts": hist.tolist(),
+                "edges": bin_edges.tolist()
             },
             "statistics": {
                 "mean": round(float(np.mean(data)), 4),
@@ -221,4 +219,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Writes PNG files only; the non-interactive backend avoids probing for a GUI
+    plt.switch_backend("Agg")
     main()
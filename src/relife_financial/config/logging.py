@@ -59,6 +59,15 @@ class RichStructuredLogger:
         else:
             return f"{msg} [{extra_str}]"
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Return whether the underlying logger would emit a record at ``level``.
+
+        Lets callers skip building expensive structured payloads that would
+        be discarded at the configured log level.
+        """
+
+        return self._logger.isEnabledFor(level)
+
     def info(self, msg: str, **kwargs: Any) -> None:
         """Log an info message with optional structured data."""
 
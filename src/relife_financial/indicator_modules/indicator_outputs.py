@@ -92,15 +92,19 @@ def get_distribution_summary(
     if percentiles is None:
         percentiles = [5, 10, 25, 50, 75, 90, 95]
     
+    raw_data = simulation_results['raw_data'][indicator.lower()]
+    
     # Get from pre-computed summary if using default percentiles
     if percentiles == [5, 10, 25, 50, 75, 90, 95]:
-        summary = simulation_results['summary']['percentiles'][indicator].copy()
+        # Percentiles NamedTuple rows (simulation engine) or plain dicts (legacy results)
+        p = simulation_results['summary']['percentiles'][indicator]
+        summary = p._asdict() if hasattr(p, "_asdict") else dict(p)
     else:
-        raw_data = simulation_results['raw_data'][indicator.lower()]
-        summary = {f"P{p}": np.nanpercentile(raw_data, p) for p in percentiles}
+        # One selection pass for all requested levels instead of one per level
+        values = np.nanpercentile(raw_data, percentiles)
+        summary = {f"P{p}": v for p, v in zip(percentiles, values)}
     
     # Add mean and std
-    raw_data = simulation_results['raw_data'][indicator.lower()]
     summary['mean'] = float(np.nanmean(raw_data))
     summary['std'] = float(np.nanstd(raw_data))
     
@@ -233,7 +237,10 @@ def get_indicator_probability(
     elif operator == '!=':
         mask = ~np.isclose(raw_data, threshold)
     
-    return float(np.mean(mask))
+    if mask.size == 0:
+        return float('nan')
+    # Count hits directly instead of averaging an upcast float64 copy of the mask
+    return np.count_nonzero(mask) / mask.size
 
 
 def get_all_indicators_summary(
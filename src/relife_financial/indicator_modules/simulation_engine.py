@@ -18,7 +18,7 @@ Scenario calibration:
 from __future__ import annotations
 
 import math
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 
 import numpy as np
 import numpy_financial as npf
@@ -91,8 +91,14 @@ def _build_kpi_histogram_payload(
     *,
     bins: int = 30,
     project_lifetime: int | None = None,
+    percentiles: Percentiles | None = None,
 ) -> dict:
-    """Build histogram payload with feasible/infeasible split for frontend rendering."""
+    """
+    Build histogram payload with feasible/infeasible split for frontend rendering.
+
+    `percentiles` may carry the summary row already computed over the same
+    values; its P10/P50/P90 are reused when only NaNs are dropped here.
+    """
     raw = np.asarray(values, dtype=float)
     empty: dict = {
         "bin_edges": [],
@@ -108,33 +114,55 @@ def _build_kpi_histogram_payload(
     if a.size == 0:
         return empty
 
+    # One sort serves the bin edges, both split histograms and the percentiles.
+    # Each feasibility rule is a threshold, so its two sides are contiguous in
+    # the sorted array: infeasible = sorted_a[:split] (low) or [split:] (high).
+    sorted_a = np.sort(a)
+    lo, hi = sorted_a[0], sorted_a[-1]
     if name in ("PBP", "DPP"):
+        infeasible_high = True
         if project_lifetime is not None:
-            infeasible_mask = a > float(project_lifetime)
+            split = int(np.searchsorted(sorted_a, float(project_lifetime), side="right"))
         else:
-            infeasible_mask = np.zeros_like(a, dtype=bool)
-        if a.size == 1 or np.isclose(a.min(), a.max()):
+            split = a.size
+        if a.size == 1 or np.isclose(lo, hi):
             center = float(a[0])
-            bin_edges = np.array([max(center - 0.5, 0.0), center + 0.5], dtype=float)
+            # Passed through histogram_bin_edges for np.histogram's monotonicity check
+            bin_edges = np.histogram_bin_edges(
+                sorted_a, bins=np.array([max(center - 0.5, 0.0), center + 0.5], dtype=float)
+            )
         else:
-            bin_edges = np.histogram_bin_edges(a, bins=bins)
+            bin_edges = np.histogram_bin_edges(sorted_a, bins=bins, range=(lo, hi))
     else:
+        infeasible_high = False
         if name in ("NPV", "IRR", "ROI"):
-            infeasible_mask = a < 0
+            split = int(np.searchsorted(sorted_a, 0.0, side="left"))
         else:
-            infeasible_mask = np.zeros_like(a, dtype=bool)
-        bin_edges = np.histogram_bin_edges(a, bins=bins)
+            split = 0
+        bin_edges = np.histogram_bin_edges(sorted_a, bins=bins, range=(lo, hi))
+
+    # Same bin assignment as np.histogram: [e_i, e_i+1), last bin closed
+    cum = np.concatenate((
+        np.searchsorted(sorted_a, bin_edges[:-1], side="left"),
+        np.searchsorted(sorted_a, bin_edges[-1:], side="right"),
+    ))
+    low_counts = np.diff(np.minimum(cum, split))
+    high_counts = np.diff(np.maximum(cum, split))
+    if infeasible_high:
+        feasible_counts, infeasible_counts = low_counts, high_counts
+    else:
+        feasible_counts, infeasible_counts = high_counts, low_counts
 
-    feasible = a[~infeasible_mask]
-    infeasible = a[infeasible_mask]
-    feasible_counts, _ = np.histogram(feasible, bins=bin_edges)
-    infeasible_counts, _ = np.histogram(infeasible, bins=bin_edges)
-    p10, p50, p90 = np.nanpercentile(a, [10, 50, 90])
+    if percentiles is not None and a.size == raw.size - np.count_nonzero(np.isnan(raw)):
+        p10, p50, p90 = percentiles.P10, percentiles.P50, percentiles.P90
+    else:
+        p10, p50, p90 = np.percentile(sorted_a, [10, 50, 90])
 
+    # Arrays stay ndarrays; the service's sanitizer converts them in one pass
     return {
-        "bin_edges": bin_edges.tolist(),
-        "feasible_counts": feasible_counts.tolist(),
-        "infeasible_counts": infeasible_counts.tolist(),
+        "bin_edges": bin_edges,
+        "feasible_counts": feasible_counts,
+        "infeasible_counts": infeasible_counts,
         "p10": float(p10),
         "p50": float(p50),
         "p90": float(p90),
@@ -263,6 +291,15 @@ def NPV(d_r: float, flows: list) -> float:
         raise SimulationComputationError(f"Failed to compute NPV: {exc}") from exc
 
 
+def _npv_over_sims(d_r: np.ndarray, paths: np.ndarray) -> np.ndarray:
+    """NPV of every scenario row of `paths`; same divide-then-sum as npf.npv."""
+    periods = np.arange(paths.shape[1])
+    # One (n_sims, T+1) buffer holds the discount divisors, then the discounted flows
+    discounted = np.power(1 + d_r[:, None], periods)
+    np.divide(paths, discounted, out=discounted)
+    return discounted.sum(axis=1)
+
+
 def PBP(flows: list, loan: bool = False, loan_term: int = 0) -> float:
     """Simple (undiscounted) Payback Period in years, linearly interpolated."""
     _validate_flows(flows)
@@ -312,10 +349,13 @@ def DPP(
     _validate_flows(flows)
     try:
         discounted = [flows[0]]
+        total = flows[0]  # running prefix sum instead of re-summing the list each year
         for i in range(1, max_years + 1):
             cf = float(flows[i]) if i < len(flows) else float(flows[-1])
-            discounted.append(cf * np.power(1 + float(d_r), -i))
-            if sum(discounted) >= 0:
+            d_cf = cf * np.power(1 + float(d_r), -i)
+            discounted.append(d_cf)
+            total += d_cf
+            if total >= 0:
                 break
         dpp = PBP(discounted)
         if loan and not np.isnan(dpp) and dpp < loan_term:
@@ -333,10 +373,77 @@ def ROI(flows: list) -> float:
     initial_investment = -float(flows[0])
     if initial_investment == 0:
         return np.nan
-    net_profit = sum(float(v) for v in flows[1:])
+    net_profit = sum(map(float, flows[1:]))
     return (net_profit - initial_investment) / initial_investment
 
 
+# ── Scenario-block KPIs ───────────────────────────────────────────────────────
+# Array forms of PBP/DPP/ROI over an (n_sims, T+1) block of cash-flow paths.
+# Running totals use cumsum (sequential, like the scalar loops), so every
+# value matches the scalar function applied to the same row.
+
+def _extend_years(yearly: np.ndarray, max_years: int) -> np.ndarray:
+    """Years 1..max_years, repeating the last year past the horizon as PBP/DPP do."""
+    n_years = yearly.shape[1]
+    if n_years >= max_years:
+        return yearly[:, :max_years]
+    out = np.empty((yearly.shape[0], max_years))
+    out[:, :n_years] = yearly
+    out[:, n_years:] = yearly[:, -1:]
+    return out
+
+
+def _payback_over_sims(initial: np.ndarray, yearly: np.ndarray) -> np.ndarray:
+    """PBP per scenario from Year 0 flows and (n_sims, max_years) yearly flows."""
+    investment = initial * -1
+    total = np.cumsum(yearly, axis=1)
+    hit = total >= investment[:, None]
+    reached = hit.any(axis=1) & (investment > 0)
+
+    rows = np.arange(yearly.shape[0])
+    year = hit.argmax(axis=1)  # payback year - 1
+    previous = np.where(year > 0, total[rows, year - 1], 0.0)
+    remaining = investment - previous
+    current_year_cf = total[rows, year] - previous
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pbp = np.where(current_year_cf != 0, year + remaining / current_year_cf, year + 1.0)
+    return np.where(reached, pbp, np.nan)
+
+
+def _pbp_over_sims(paths: np.ndarray, max_years: int = 100) -> np.ndarray:
+    """PBP(flows) for every scenario row (no loan floor)."""
+    return _payback_over_sims(paths[:, 0], _extend_years(paths[:, 1:], max_years))
+
+
+def _dpp_over_sims(d_r: np.ndarray, paths: np.ndarray, max_years: int = 100) -> np.ndarray:
+    """DPP(d_r, T, flows) for every scenario row (no loan floor)."""
+    # One scalar exponent per year: that is the np.power path DPP takes, whereas
+    # an array of exponents can differ from it in the last ulp.
+    base = 1 + d_r
+    factors = np.empty((max_years, d_r.size))
+    for i in range(1, max_years + 1):
+        np.power(base, -i, out=factors[i - 1])
+    d_cf = _extend_years(paths[:, 1:], max_years) * factors.T
+
+    # DPP stops discounting once its running total from Year 0 turns
+    # non-negative; PBP then repeats the last discounted flow of that list.
+    total = np.cumsum(np.concatenate([paths[:, :1], d_cf], axis=1), axis=1)[:, 1:]
+    hit = total >= 0
+    stop = np.where(hit.any(axis=1), hit.argmax(axis=1), max_years - 1)
+    last = d_cf[np.arange(d_cf.shape[0]), stop]
+    d_cf = np.where(np.arange(max_years) > stop[:, None], last[:, None], d_cf)
+    return _payback_over_sims(paths[:, 0], d_cf)
+
+
+def _roi_over_sims(paths: np.ndarray) -> np.ndarray:
+    """ROI(flows) for every scenario row."""
+    initial_investment = -paths[:, 0]
+    net_profit = np.cumsum(paths[:, 1:], axis=1)[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi = (net_profit - initial_investment) / initial_investment
+    return np.where(initial_investment == 0, np.nan, roi)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Cash-flow functions -- 12 financing schemes
 # ─────────────────────────────────────────────────────────────────────────────
@@ -344,6 +451,9 @@ def ROI(flows: list) -> float:
 # Index 0 is Year 0 (investment/setup); indices 1..T are operating years.
 # Rate inputs (fixed_interest, p_ESCO, royalty_rate, fee_plat, share_crowd)
 # are expressed as fractions (e.g. 0.05 for 5%).
+# Market inputs are indexed by year. Each entry may be a scalar (one scenario)
+# or an array over scenarios; the arithmetic is element-wise either way, so
+# get_kpi_results evaluates every scenario of a scheme in a single call.
 # ─────────────────────────────────────────────────────────────────────────────
 
 def cash_flows(
@@ -589,11 +699,9 @@ def cash_flows_first_out_contract(
         AS_t = annual_energy_savings * electricity_prices[idx]
         op_cf = AS_t - om_t
         remaining = capex - D_paid
-        if remaining <= 0:
-            D_t = 0.0
-        else:
-            D_t = min(max(0.0, op_cf), remaining)
-            D_paid += D_t
+        # Nothing is repaid once CAPEX is recouped (remaining <= 0)
+        D_t = np.minimum(np.maximum(0.0, op_cf), np.maximum(remaining, 0.0))
+        D_paid += D_t
         inflows.append(AS_t)
         outflows.append(om_t + D_t)
         flows.append(op_cf - D_t)
@@ -630,7 +738,7 @@ def cash_flows_epc_guaranteed_savings(
             outstanding -= principal
         else:
             D_t = 0.0
-        comp = max(0.0, gs_t - AS_t)
+        comp = np.maximum(0.0, gs_t - AS_t)
         inflows.append(AS_t + comp)
         outflows.append(om_t + D_t)
         flows.append(AS_t - om_t - D_t + comp)
@@ -727,9 +835,10 @@ def cash_flows_equity_crowdfunding(
             cumulative_infl *= (1.0 + inflation_rate[idx] / 100.0)
             revenue = annual_energy_savings * electricity_prices[idx]
             costs = annual_maintenace_cost * cumulative_infl
-            distributable = revenue - costs
-            dev_cf = distributable * (1 - share_crowd) if distributable > 0 else 0.0
-            crowd_cf = distributable - dev_cf if distributable > 0 else 0.0
+            # Only positive distributable cash is split; losses pay nobody
+            distributable = np.maximum(revenue - costs, 0.0)
+            dev_cf = distributable * (1 - share_crowd)
+            crowd_cf = distributable - dev_cf
             inflows.append(revenue)
             outflows.append(costs + crowd_cf)
             flows.append(dev_cf)
@@ -873,10 +982,18 @@ def prepare_cashflow_inputs(
     loan_interest_rate: list | None = None,
     annual_energy_savings: float | None = None,
 ) -> dict:
-    """Inject Monte Carlo sampled market variables into a scheme's base inputs."""
+    """
+    Inject Monte Carlo sampled market variables into a scheme's base inputs.
+
+    Either one scenario (per-year lists, scalar savings) or all scenarios at
+    once (per-year rows of scenario columns, one savings value per scenario).
+    """
     inputs = dict(base_inputs)
     if "annual_energy_savings" in inputs and annual_energy_savings is not None:
-        inputs["annual_energy_savings"] = float(annual_energy_savings)
+        if isinstance(annual_energy_savings, np.ndarray):
+            inputs["annual_energy_savings"] = annual_energy_savings
+        else:
+            inputs["annual_energy_savings"] = float(annual_energy_savings)
     if "electricity_prices" in inputs:
         inputs["electricity_prices"] = electricity_prices
     if "inflation_rate" in inputs:
@@ -887,6 +1004,65 @@ def prepare_cashflow_inputs(
     return inputs
 
 
+def _fill_cash_flow_paths(cashflow_function: Callable, inputs: dict, out: np.ndarray) -> None:
+    """
+    Evaluate a scheme's cash-flow function once for every scenario and write
+    (flows, inflows, outflows) into `out`, shape (3, n_sims, T + 1).
+
+    `inputs` carries per-year scenario columns, so each returned year entry is
+    either a scalar (Year 0 terms) or an (n_sims,) array; both broadcast into
+    the year column.
+    """
+    for buf, series in zip(out, cashflow_function(**inputs)):
+        for t, value in enumerate(series):
+            buf[:, t] = value
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Result containers
+# ─────────────────────────────────────────────────────────────────────────────
+
+PERCENTILE_LEVELS: tuple = (5, 10, 25, 50, 75, 90, 95)
+
+# Same levels as a prebuilt read-only array, so percentile calls skip re-converting the tuple
+_PERCENTILE_Q = np.array(PERCENTILE_LEVELS, dtype=np.float64)
+_PERCENTILE_Q.flags.writeable = False
+_PERCENTILE_KEYS: tuple = tuple(f"P{q}" for q in PERCENTILE_LEVELS)
+
+# Row order of the per-scheme KPI matrix and of summary["percentiles"]
+KPI_ROWS: tuple = ("IRR", "NPV", "PBP", "DPP", "ROI", "total_repayment")
+
+
+class Percentiles(NamedTuple):
+    """P5-P95 summary of one KPI distribution (field order matches PERCENTILE_LEVELS)."""
+    P5: float
+    P10: float
+    P25: float
+    P50: float
+    P75: float
+    P90: float
+    P95: float
+
+
+def _percentiles_over_sims(block: np.ndarray) -> np.ndarray:
+    """
+    PERCENTILE_LEVELS of `block` along axis 1 (the simulation axis).
+
+    Rows (axis 0) without NaN take the plain np.percentile path; only rows that
+    contain NaN pay for np.nanpercentile's masking. Both give identical values
+    on NaN-free data. Returns shape (n_levels, block.shape[0], *block.shape[2:]).
+    """
+    has_nan = np.isnan(block).any(axis=tuple(range(1, block.ndim)))
+    if not has_nan.any():
+        return np.percentile(block, _PERCENTILE_Q, axis=1)
+    if has_nan.all():
+        return np.nanpercentile(block, _PERCENTILE_Q, axis=1)
+    out = np.empty((_PERCENTILE_Q.size, block.shape[0]) + block.shape[2:])
+    out[:, ~has_nan] = np.percentile(block[~has_nan], _PERCENTILE_Q, axis=1)
+    out[:, has_nan] = np.nanpercentile(block[has_nan], _PERCENTILE_Q, axis=1)
+    return out
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main Monte Carlo runner
 # ─────────────────────────────────────────────────────────────────────────────
@@ -926,6 +1102,7 @@ def get_kpi_results(
     dict
         Keys are scheme_type strings. Each value contains:
         scheme_id, scheme_family, summary, kpi_histograms, cashflow_distributions.
+        Histogram arrays and per-year percentile rows are numpy arrays.
     """
     _ensure(capex > 0,                   "capex must be positive.")
     _ensure(annual_energy_savings > 0,   "annual_energy_savings must be positive.")
@@ -987,6 +1164,11 @@ def get_kpi_results(
     elec  = np.maximum(elec,   1e-9)
     energy_savings_factor = np.maximum(energy_savings_factor, 0.0)
 
+    # Per-year scenario columns (row t = year t + 1 across all scenarios)
+    elec_by_year = np.ascontiguousarray(elec.T)
+    infl_by_year = np.ascontiguousarray(infl.T)
+    rate_by_year = np.ascontiguousarray(rate.T)
+
     # ── Per-scheme simulation ─────────────────────────────────────────────────
     results: dict = {}
 
@@ -996,75 +1178,82 @@ def get_kpi_results(
         cashflow_function = scheme_def["cashflow_function"]
         base_inputs       = scheme_def["base_inputs"]
 
-        irr             = np.full(n_sims, np.nan)
-        npv_arr         = np.full(n_sims, np.nan)
-        pbp_arr         = np.full(n_sims, np.nan)
-        dpp_arr         = np.full(n_sims, np.nan)
-        roi_arr         = np.full(n_sims, np.nan)
-        total_repayment = np.full(n_sims, np.nan)
-        cashflow_paths  = np.full((n_sims, T + 1), np.nan)
-        inflow_paths    = np.full((n_sims, T + 1), np.nan)
-        outflow_paths   = np.full((n_sims, T + 1), np.nan)
+        # Struct-of-arrays buffers; the names below are row views into them.
+        # kpi rows follow KPI_ROWS (PBP/DPP censored after the loop) plus the
+        # raw PBP/DPP rows, so kpi[:len(KPI_ROWS)] is the summary block as is.
+        kpi   = np.full((len(KPI_ROWS) + 2, n_sims), np.nan)
+        paths = np.empty((3, n_sims, T + 1))
+        irr, npv_arr, pbp_censored, dpp_censored, roi_arr, total_repayment, pbp_arr, dpp_arr = kpi
+        cashflow_paths, inflow_paths, outflow_paths = paths
 
         base_es = float(base_inputs.get("annual_energy_savings", annual_energy_savings))
 
-        for i in range(n_sims):
-            inputs_i = prepare_cashflow_inputs(
-                base_inputs=base_inputs,
-                electricity_prices=elec[i].tolist(),
-                inflation_rate=infl[i].tolist(),
-                loan_interest_rate=rate[i].tolist(),
-                annual_energy_savings=base_es * float(energy_savings_factor[i]),
+        # All scenarios' cash flows in one vectorised pass over the years
+        inputs = prepare_cashflow_inputs(
+            base_inputs=base_inputs,
+            electricity_prices=elec_by_year,
+            inflation_rate=infl_by_year,
+            loan_interest_rate=rate_by_year,
+            annual_energy_savings=base_es * energy_savings_factor,
+        )
+        try:
+            _fill_cash_flow_paths(cashflow_function, inputs, paths)
+        except FinancialSimulationError:
+            raise
+        except Exception as exc:
+            raise SimulationComputationError(
+                f"Cash-flow generation failed for '{scheme_type}': {exc}"
+            ) from exc
+
+        finite = np.isfinite(cashflow_paths)
+        if not finite.all():
+            i, idx = np.argwhere(~finite)[0]
+            raise SimulationComputationError(
+                f"Cash-flow at index {idx} must be finite (scenario {i}). Got: {float(cashflow_paths[i, idx])!r}"
             )
+
+        total_repayment[:] = outflow_paths[:, 1:].sum(axis=1)
+        npv_arr[:]         = _npv_over_sims(disc[:, 0], cashflow_paths)
+        pbp_arr[:]         = _pbp_over_sims(cashflow_paths)
+        dpp_arr[:]         = _dpp_over_sims(disc[:, 0], cashflow_paths)
+        roi_arr[:]         = _roi_over_sims(cashflow_paths)
+        if inputs.get("term_years"):
+            # Payback is never reported before the loan is repaid
+            loan_term = float(int(inputs["term_years"]))
+            np.copyto(pbp_arr, loan_term, where=pbp_arr < loan_term)
+            np.copyto(dpp_arr, loan_term, where=dpp_arr < loan_term)
+
+        # IRR needs a polynomial root solve per scenario; rows are already validated
+        for i in range(n_sims):
             try:
-                flows, inflows_i, outflows_i = cashflow_function(**inputs_i)
-                _validate_flows(flows)
-
-                irr[i]         = IRR(flows)
-                npv_arr[i]     = NPV(float(disc[i, 0]), flows)
-                has_term       = "term_years" in inputs_i and inputs_i["term_years"]
-                pbp_arr[i]     = PBP(flows, loan=bool(has_term), loan_term=int(inputs_i.get("term_years", 0)))
-                dpp_arr[i]     = DPP(float(disc[i, 0]), T, flows, loan=bool(has_term), loan_term=int(inputs_i.get("term_years", 0)))
-                roi_arr[i]     = ROI(flows)
-                total_repayment[i] = float(np.sum(np.asarray(outflows_i[1:], dtype=float)))
-
-                cashflow_paths[i, :] = np.asarray(flows, dtype=float)
-                inflow_paths[i, :]   = np.asarray(inflows_i, dtype=float)
-                outflow_paths[i, :]  = np.asarray(outflows_i, dtype=float)
-            except FinancialSimulationError:
-                raise
+                irr[i] = npf.irr(cashflow_paths[i])
             except Exception as exc:
                 raise SimulationComputationError(
-                    f"Simulation failed for '{scheme_type}' at iteration {i}: {exc}"
+                    f"Simulation failed for '{scheme_type}' at iteration {i}: Failed to compute IRR: {exc}"
                 ) from exc
 
         censor = T + 1
-        pbp_censored = np.where(~np.isfinite(pbp_arr) | (pbp_arr > T), censor, pbp_arr)
-        dpp_censored = np.where(~np.isfinite(dpp_arr) | (dpp_arr > T), censor, dpp_arr)
+        pbp_censored[:] = np.where(~np.isfinite(pbp_arr) | (pbp_arr > T), censor, pbp_arr)
+        dpp_censored[:] = np.where(~np.isfinite(dpp_arr) | (dpp_arr > T), censor, dpp_arr)
         disc_target = float(np.nanmedian(disc[:, 0]))
 
-        def pct(a, qs=(5, 10, 25, 50, 75, 90, 95)):
-            return {f"P{q}": float(np.nanpercentile(a, q)) for q in qs}
+        # One batched quantile pass per result block instead of one call per KPI/level
+        kpi_pcts  = _percentiles_over_sims(kpi[:len(KPI_ROWS)]).T   # (n_kpis, n_levels)
+        path_pcts = _percentiles_over_sims(paths)                  # (n_levels, 3, T+1)
 
-        def pct_by_year(paths, qs=(5, 10, 25, 50, 75, 90, 95)):
-            arr = np.asarray(paths, dtype=float)
-            return {f"P{q}": np.nanpercentile(arr, q, axis=0).tolist() for q in qs}
+        def pct_by_year(k):
+            return dict(zip(_PERCENTILE_KEYS, path_pcts[:, k]))
 
         def pr(mask):
-            return float(np.nanmean(np.asarray(mask, dtype=bool)))
+            return np.count_nonzero(mask) / mask.size
+
+        summary_pcts = {name: Percentiles(*row) for name, row in zip(KPI_ROWS, kpi_pcts.tolist())}
 
         results[scheme_type] = {
             "scheme_id":     scheme_def["scheme_id"],
             "scheme_family": scheme_family,
             "summary": {
-                "percentiles": {
-                    "IRR":             pct(irr),
-                    "NPV":             pct(npv_arr),
-                    "PBP":             pct(pbp_censored),
-                    "DPP":             pct(dpp_censored),
-                    "ROI":             pct(roi_arr),
-                    "total_repayment": pct(total_repayment),
-                },
+                "percentiles": summary_pcts,
                 "probabilities": {
                     "Pr(NPV > 0)":          pr(npv_arr > 0),
                     f"Pr(PBP < {T}y)":      pr(pbp_arr < T),
@@ -1074,17 +1263,18 @@ def get_kpi_results(
                 "n_sims":           n_sims,
             },
             "kpi_histograms": {
-                "NPV": _build_kpi_histogram_payload("NPV", npv_arr),
-                "IRR": _build_kpi_histogram_payload("IRR", irr),
-                "ROI": _build_kpi_histogram_payload("ROI", roi_arr),
+                # PBP/DPP summaries are censored, so only these rows are reusable
+                "NPV": _build_kpi_histogram_payload("NPV", npv_arr, percentiles=summary_pcts["NPV"]),
+                "IRR": _build_kpi_histogram_payload("IRR", irr, percentiles=summary_pcts["IRR"]),
+                "ROI": _build_kpi_histogram_payload("ROI", roi_arr, percentiles=summary_pcts["ROI"]),
                 "PBP": _build_kpi_histogram_payload("PBP", pbp_arr, project_lifetime=T),
                 "DPP": _build_kpi_histogram_payload("DPP", dpp_arr, project_lifetime=T),
             },
             "cashflow_distributions": {
                 "years":      list(range(T + 1)),
-                "cash_flows": pct_by_year(cashflow_paths),
-                "inflows":    pct_by_year(inflow_paths),
-                "outflows":   pct_by_year(outflow_paths),
+                "cash_flows": pct_by_year(0),
+                "inflows":    pct_by_year(1),
+                "outflows":   pct_by_year(2),
             },
         }
 
@@ -10,7 +10,15 @@ import matplotlib.pyplot as plt
 import base64
 from io import BytesIO
 from typing import Dict, Any, Optional, Union
-from indicator_outputs import get_full_distribution
+from .indicator_outputs import get_full_distribution
+
+
+def _figure_to_data_uri(fig: plt.Figure) -> str:
+    """Render a figure to an in-memory PNG data URI and close it."""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    return f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode('ascii')}"
 
 
 def plot_indicator_distribution(
@@ -123,12 +131,7 @@ def plot_indicator_distribution(
     
     # Handle output
     if return_base64:
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        return _figure_to_data_uri(fig)
     
     if save_path:
         fig.savefig(save_path, dpi=150, bbox_inches='tight')
@@ -201,12 +204,7 @@ def plot_success_probabilities(
     
     # Handle output
     if return_base64:
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        return _figure_to_data_uri(fig)
     
     if save_path:
         fig.savefig(save_path, dpi=150, bbox_inches='tight')
@@ -336,12 +334,7 @@ def plot_all_indicators(
     
     # Handle output
     if return_base64:
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        return _figure_to_data_uri(fig)
     
     if save_path:
         fig.savefig(save_path, dpi=150, bbox_inches='tight')
@@ -423,12 +416,7 @@ def compare_indicators(
     
     # Handle output
     if return_base64:
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        return _figure_to_data_uri(fig)
     
     if save_path:
         fig.savefig(save_path, dpi=150, bbox_inches='tight')
@@ -443,6 +431,95 @@ def compare_indicators(
 
 
 
+def _annuity_payment(rate: float, nper: int, pv: float) -> float:
+    """
+    Level annual payment that amortises a loan of `pv` over `nper` years.
+    
+    Closed form of ``-numpy_financial.pmt(rate, nper, pv)`` (end-of-period
+    payments, zero future value), evaluated in the same order so results match
+    bit for bit.
+    """
+    if rate == 0:
+        return pv / nper
+    growth = np.power(1.0 + rate, nper)
+    return float(pv * growth / ((growth - 1.0) / rate))
+
+
+def _resolve_loan_rate(loan_rate: Optional[float], market_dist: Dict[str, Any]) -> float:
+    """
+    Loan rate as a decimal: the explicit rate if given, else the first-year
+    median from market_dist['loan_rate']['mu'] (stored in %), else 4%.
+    """
+    if loan_rate is not None:
+        return loan_rate
+    loan_rate_mu = market_dist.get('loan_rate', {}).get('mu')
+    if loan_rate_mu is not None:
+        return float(loan_rate_mu[0]) / 100  # Convert percentage to decimal
+    return 0.04  # Fallback to 4%
+
+
+def _private_cash_flow_path(
+    equity: float,
+    annual_energy_savings: float,
+    annual_maintenance_cost: float,
+    elec_prices: np.ndarray,
+    inflation_pct: np.ndarray,
+    annual_loan_payment: float,
+    loan_term: int,
+    project_lifetime: int,
+) -> tuple:
+    """
+    Compute the median-path annual cash flows behind the private cash flow chart.
+    
+    Every step is a whole-array NumPy operation, so the cost does not grow with
+    Python-level iterations over the project lifetime. The Year 0..L timelines
+    are preallocated once and filled in place rather than concatenated.
+    
+    Returns
+    -------
+    tuple
+        (inflows, outflows, net_cf, cumulative_position, breakeven_year), each
+        array of length project_lifetime + 1 starting at Year 0. Outflows are
+        negative; Year 0 holds the out-of-pocket investment (-equity).
+        breakeven_year is None if the cumulative position never turns non-negative.
+    """
+    L = project_lifetime
+    inflows = np.empty(L + 1)
+    outflows = np.empty(L + 1)
+    net_cf = np.empty(L + 1)
+    
+    # Year 0: Out-of-pocket investment, no inflows
+    inflows[0] = 0.0
+    outflows[0] = -equity
+    net_cf[0] = -equity
+    
+    # INFLOWS: Energy savings value (revenue)
+    annual_revenues = inflows[1:]
+    np.multiply(annual_energy_savings, elec_prices[:L], out=annual_revenues)
+    
+    # OUTFLOWS: Maintenance costs (inflated over time)
+    inflation_factors = 1.0 + np.asarray(inflation_pct[:L], dtype=float) / 100.0
+    total_annual_outflows = annual_maintenance_cost * np.cumprod(inflation_factors)
+    
+    # OUTFLOWS: Loan payments (only for loan term years)
+    total_annual_outflows[:loan_term] += annual_loan_payment
+    
+    np.negative(total_annual_outflows, out=outflows[1:])
+    
+    # Net cash flow per year (operational years only)
+    np.subtract(annual_revenues, total_annual_outflows, out=net_cf[1:])
+    
+    # Cumulative position (for break-even calculation)
+    cumulative_position = np.cumsum(net_cf)
+    
+    # Find break-even year: first non-negative position (argmax of the mask), if any
+    breakeven_mask = cumulative_position >= 0
+    first_nonneg = int(np.argmax(breakeven_mask))
+    breakeven_year = first_nonneg if breakeven_mask[first_nonneg] else None
+    
+    return inflows, outflows, net_cf, cumulative_position, breakeven_year
+
+
 def generate_private_cash_flow_chart(
     capex: float,
     project_lifetime: int,
@@ -504,55 +581,31 @@ def generate_private_cash_flow_chart(
     - Inflation rates stored as percentages in distributions (e.g., 2.5 for 2.5%)
     - Includes enhanced styling with colored annotations and value labels
     """
-    import numpy_financial as npf
-    
     # Get market distributions
     market_dist = market_distributions
     
     # Calculate using median market values
-    median_elec_prices = np.exp(market_dist['elec_price']['mu_ln'])
+    median_elec_prices = np.exp(market_dist['elec_price']['mu_ln'][:project_lifetime])
     median_inflation = market_dist['inflation']['mu']
     
-    # INFLOWS: Energy savings value (revenue)
-    annual_revenues = annual_energy_savings * median_elec_prices[:project_lifetime]
-    
-    # OUTFLOWS: Maintenance costs (inflated over time)
-    annual_opex = np.array([annual_maintenance_cost * np.prod([1 + median_inflation[j]/100 for j in range(i+1)]) 
-                            for i in range(project_lifetime)])
-    
-    # OUTFLOWS: Loan payments (if loan exists)
+    # Calculate annual loan payment using PMT formula (if loan exists)
+    annual_loan_payment = 0.0
     if loan_amount > 0 and loan_term > 0:
-        # Determine loan rate
-        if loan_rate is None:
-            loan_rate_mu = market_dist.get('loan_rate', {}).get('mu')
-            if loan_rate_mu is not None:
-                loan_rate = float(loan_rate_mu[0]) / 100  # Convert percentage to decimal
-            else:
-                loan_rate = 0.04  # Fallback to 4%
-        
-        # Calculate annual loan payment using PMT formula
-        annual_loan_payment = npf.pmt(loan_rate, loan_term, -loan_amount)
-        
-        # Create array of loan payments (only for loan term years)
-        annual_loan_payments = np.zeros(project_lifetime)
-        annual_loan_payments[:loan_term] = annual_loan_payment
-    else:
-        annual_loan_payments = np.zeros(project_lifetime)
-    
-    # Total annual outflows (maintenance + loan payments)
-    total_annual_outflows = annual_opex + annual_loan_payments
-    
-    # Net cash flow per year (operational years only)
-    annual_net_cf = annual_revenues - total_annual_outflows
-    
-    # Cumulative position (for break-even calculation)
-    cumulative_position = np.zeros(project_lifetime + 1)
-    cumulative_position[0] = -(capex - loan_amount)  # Year 0: Out-of-pocket investment
-    for i in range(project_lifetime):
-        cumulative_position[i+1] = cumulative_position[i] + annual_net_cf[i]
-    
-    # Find break-even year
-    breakeven_year = np.where(cumulative_position >= 0)[0][0] if any(cumulative_position >= 0) else None
+        loan_rate = _resolve_loan_rate(loan_rate, market_dist)
+        annual_loan_payment = _annuity_payment(loan_rate, loan_term, loan_amount)
+    
+    all_inflows, all_outflows, all_net_cf, cumulative_position, breakeven_year = (
+        _private_cash_flow_path(
+            equity=capex - loan_amount,
+            annual_energy_savings=annual_energy_savings,
+            annual_maintenance_cost=annual_maintenance_cost,
+            elec_prices=median_elec_prices,
+            inflation_pct=median_inflation,
+            annual_loan_payment=annual_loan_payment,
+            loan_term=loan_term,
+            project_lifetime=project_lifetime,
+        )
+    )
     
     # Create figure for annual cash flows
     fig, ax = plt.subplots(1, 1, figsize=figsize)
@@ -561,14 +614,6 @@ def generate_private_cash_flow_chart(
     years_all = np.arange(0, project_lifetime + 1)
     bar_width = 0.35
     
-    # Year 0: Initial out-of-pocket investment
-    initial_investment = -(capex - loan_amount)
-    
-    # Combine year 0 with operational years for plotting
-    all_inflows = np.concatenate([[0], annual_revenues])  # Year 0 has no inflows
-    all_outflows = np.concatenate([[initial_investment], -total_annual_outflows])  # Year 0 has investment outflow
-    all_net_cf = np.concatenate([[initial_investment], annual_net_cf])  # Net cash flow including year 0
-    
     x_pos = np.arange(len(years_all))
     
     # Plot inflows (positive)
@@ -640,11 +685,6 @@ def generate_private_cash_flow_chart(
     
     # Return as base64 or Figure
     if return_base64:
-        buf = BytesIO()
-        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        return _figure_to_data_uri(fig)
     else:
         return fig
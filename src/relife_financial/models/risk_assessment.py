@@ -7,7 +7,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
 
 
 class OutputLevel(str, Enum):
@@ -220,6 +220,9 @@ class RenovationAction(BaseModel):
 # Request / Response
 # ─────────────────────────────────────────────────────────────────────────────
 
+_VALID_INDICATORS: frozenset[str] = frozenset({"IRR", "NPV", "PBP", "DPP", "ROI"})
+
+
 class RiskAssessmentRequest(BaseModel):
     """Request model for multi-scheme Monte Carlo risk assessment."""
 
@@ -316,10 +319,11 @@ class RiskAssessmentRequest(BaseModel):
     @field_validator("indicators")
     @classmethod
     def validate_indicators(cls, v: List[str]) -> List[str]:
-        valid = {"IRR", "NPV", "PBP", "DPP", "ROI"}
-        invalid = set(v) - valid
+        invalid = [x for x in v if x not in _VALID_INDICATORS]
         if invalid:
-            raise ValueError(f"Invalid indicators: {invalid}. Must be one of: {valid}")
+            raise ValueError(
+                f"Invalid indicators: {invalid}. Must be one of: {sorted(_VALID_INDICATORS)}"
+            )
         if not v:
             raise ValueError("At least one indicator must be specified")
         return v
@@ -373,6 +377,25 @@ class RiskAssessmentResponse(BaseModel):
         description="Global metadata: capex, project_lifetime, n_sims, output_level, etc.",
     )
 
+    @field_serializer("results")
+    def serialize_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand NamedTuple percentile rows into {"P5": ..., "P95": ...} objects."""
+        out: Dict[str, Any] = {}
+        for scheme_type, data in results.items():
+            summary = data.get("summary") if isinstance(data, dict) else None
+            percentiles = summary.get("percentiles") if isinstance(summary, dict) else None
+            if isinstance(percentiles, dict):
+                summary = {
+                    **summary,
+                    "percentiles": {
+                        k: v._asdict() if hasattr(v, "_asdict") else v
+                        for k, v in percentiles.items()
+                    },
+                }
+                data = {**data, "summary": summary}
+            out[scheme_type] = data
+        return out
+
     model_config = {
         "json_schema_extra": {
             "examples": [
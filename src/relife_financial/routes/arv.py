@@ -8,6 +8,7 @@ Endpoints:
     POST /arv - Predict property value after renovation
 """
 
+import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
@@ -133,30 +134,32 @@ async def calculate_arv(
     
     user_id = current_user.user_id if current_user else "anonymous"
     
-    logger.info(
-        f"ARV prediction requested by user {user_id}",
-        extra={
-            "user_id": user_id,
-            "floor_area": request.floor_area,
-            "property_type": request.property_type.value,
-            "target_country": request.target_country,
-            "energy_consumption_after": request.energy_consumption_after,
-            "energy_consumption_before": request.energy_consumption_before,
-        }
-    )
-
-    try:
-        result = await predict_arv(request)
-
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            f"ARV prediction successful for user {user_id}",
+            f"ARV prediction requested by user {user_id}",
             extra={
                 "user_id": user_id,
-                "price_per_sqm": result.after.price_per_sqm,
-                "total_price": result.after.total_price,
-                "greek_epc_class": result.after.greek_epc_class,
+                "floor_area": request.floor_area,
+                "property_type": request.property_type.value,
+                "target_country": request.target_country,
+                "energy_consumption_after": request.energy_consumption_after,
+                "energy_consumption_before": request.energy_consumption_before,
             }
         )
+
+    try:
+        result = await predict_arv(request)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"ARV prediction successful for user {user_id}",
+                extra={
+                    "user_id": user_id,
+                    "price_per_sqm": result.after.price_per_sqm,
+                    "total_price": result.after.total_price,
+                    "greek_epc_class": result.after.greek_epc_class,
+                }
+            )
         
         return result
         
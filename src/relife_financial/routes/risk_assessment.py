@@ -8,9 +8,10 @@ Endpoints:
     POST /risk-assessment - Run comprehensive Monte Carlo simulation
 """
 
+import logging
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
 from relife_financial.auth.dependencies import OptionalAuthenticatedUserDep
 from relife_financial.config.logging import get_logger
@@ -31,7 +32,7 @@ async def assess_project_risk(
     request: RiskAssessmentRequest,
     current_user: OptionalAuthenticatedUserDep,
     settings: SettingsDep,
-) -> RiskAssessmentResponse:
+) -> Response:
     """
     Perform comprehensive Monte Carlo risk assessment for energy retrofit project.
     
@@ -134,28 +135,34 @@ async def assess_project_risk(
     user_id = current_user.user_id if current_user else "anonymous"
     
     try:
-        logger.info(
-            "Risk assessment requested",
-            user_id=user_id,
-            capex=request.capex,
-            project_lifetime=request.project_lifetime,
-            output_level=request.output_level.value,
-            n_schemes=len(request.schemes),
-            scheme_types=[s.scheme_type for s in request.schemes],
-            indicators=request.indicators,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk assessment requested",
+                user_id=user_id,
+                capex=request.capex,
+                project_lifetime=request.project_lifetime,
+                output_level=request.output_level.value,
+                n_schemes=len(request.schemes),
+                scheme_types=[s.scheme_type for s in request.schemes],
+                indicators=request.indicators,
+            )
         
         # Perform the risk assessment
         response = await perform_risk_assessment(request)
         
-        logger.info(
-            "Risk assessment completed successfully",
-            user_id=user_id,
-            output_level=request.output_level.value,
-            n_sims=response.metadata.get("n_sims") if response.metadata else None,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk assessment completed successfully",
+                user_id=user_id,
+                output_level=request.output_level.value,
+                n_sims=response.metadata.get("n_sims") if response.metadata else None,
+            )
         
-        return response
+        # Serialise straight to JSON bytes in pydantic-core (NaN/Inf -> null)
+        # instead of dumping to a dict and re-encoding it with stdlib json,
+        # and without the str round-trip of model_dump_json()
+        body = response.__pydantic_serializer__.to_json(response)
+        return Response(content=body, media_type="application/json")
         
     except ValueError as e:
         # Invalid input parameters
@@ -13,22 +13,26 @@ EPC Resolution Chain (Logic 2):
 
 Main Functions:
     - predict_arv: Predicts property value based on characteristics and energy consumption
-    - _load_model: Loads the trained LightGBM model (called once at startup)
+    - load_model: Loads the trained LightGBM model (called once at app startup)
     - _map_property_type: Maps English labels to Greek labels used by model
     - _build_input_dataframe: Constructs model input features
+    - _build_input_row: Constructs the encoded feature row for the booster fast path
     - resolve_epc_from_consumption: Full EPC resolution chain
 
 Dependencies:
     - joblib: For loading the trained model
-    - pandas: For input data structuring
+    - numpy: For the pre-encoded single-row feature vector
+    - pandas: For input data structuring (generic pipeline fallback)
     - lgb_model_greece.pkl: Trained LightGBM price prediction model for Greece
 """
 
 import joblib
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
 from math import inf
 
@@ -46,15 +50,20 @@ from ..models.arv import (
 # ============================================================================
 
 _MODEL = None
+_FEATURE_PLAN = None
 _MODEL_PATH = Path(__file__).parent.parent / "data" / "lgb_model_greece.pkl"
 
+# Per-deployment constant part of ARVResponse.metadata; copied per request
+_METADATA_TEMPLATE: dict = {"model_file": _MODEL_PATH.name}
 
-def _load_model():
+
+def load_model():
     """
     Load the trained LightGBM model from disk.
     
-    This function is called once when the service is first used,
-    implementing a lazy-loading singleton pattern.
+    Called from the application lifespan so the first request does not pay
+    the unpickling cost; later calls return the cached singleton. predict_arv
+    still calls it, so the service also works when no lifespan ran.
     
     Returns:
         Trained LightGBM model pipeline
@@ -63,23 +72,97 @@ def _load_model():
         FileNotFoundError: If model file doesn't exist
         Exception: If model loading fails
     """
-    global _MODEL
+    global _MODEL, _FEATURE_PLAN
     
     if _MODEL is None:
-        if not _MODEL_PATH.exists():
+        # Let joblib's open() report a missing file instead of a separate stat() call
+        try:
+            _MODEL = joblib.load(_MODEL_PATH)
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Model file not found at: {_MODEL_PATH}. "
                 "Please ensure lgb_model_greece.pkl is in the data/ directory."
-            )
-        
-        try:
-            _MODEL = joblib.load(_MODEL_PATH)
+            ) from e
         except Exception as e:
             raise RuntimeError(f"Failed to load model from {_MODEL_PATH}: {e}")
+        _FEATURE_PLAN = _compile_feature_plan(_MODEL)
     
     return _MODEL
 
 
+class _FeaturePlan(NamedTuple):
+    """Fitted preprocessing of the model pipeline, flattened for single-row encoding."""
+    booster: Any
+    n_features: int
+    onehot: tuple    # (column, {category: output index}) per one-hot input column
+    numeric: tuple   # (column, output index, mean, scale) per scaled column
+    ordinal: tuple   # (column, output index, {category: code}) per ordinal column
+
+
+def _compile_feature_plan(model) -> Optional[_FeaturePlan]:
+    """
+    Extract the fitted encoders of the model pipeline into a _FeaturePlan.
+    
+    Lets predict_arv encode a request straight into a numpy row and call the
+    LightGBM booster, skipping the per-request DataFrame and ColumnTransformer.
+    Returns None when the pipeline is not the expected
+    preprocessor (OneHotEncoder / StandardScaler / OrdinalEncoder) + LGBMRegressor
+    layout, in which case predictions go through model.predict(DataFrame).
+    """
+    try:
+        preprocessor = model.named_steps["preprocessor"]
+        booster = model.named_steps["regressor"].booster_
+    except (AttributeError, KeyError):
+        return None
+    if preprocessor.remainder != "drop" or preprocessor.sparse_output_:
+        return None
+    
+    onehot, numeric, ordinal = [], [], []
+    offset = 0
+    for _, transformer, columns in preprocessor.transformers_:
+        kind = type(transformer).__name__
+        if transformer == "drop":
+            continue
+        if kind == "OneHotEncoder":
+            # Infrequent-category grouping is not modelled; leave it to the pipeline
+            if (
+                transformer.handle_unknown != "ignore"
+                or getattr(transformer, "min_frequency", None) is not None
+                or getattr(transformer, "max_categories", None) is not None
+            ):
+                return None
+            drop_idx = transformer.drop_idx_
+            for j, column in enumerate(columns):
+                dropped = None if drop_idx is None else drop_idx[j]
+                index = {}
+                for k, category in enumerate(transformer.categories_[j].tolist()):
+                    if k == dropped:
+                        continue
+                    index[category] = offset
+                    offset += 1
+                onehot.append((column, index))
+        elif kind == "StandardScaler":
+            # Mirror StandardScaler.transform: centre/scale only when configured to
+            mean = transformer.mean_ if transformer.with_mean else np.zeros(len(columns))
+            scale = transformer.scale_ if transformer.with_std else np.ones(len(columns))
+            for j, column in enumerate(columns):
+                numeric.append((column, offset, float(mean[j]), float(scale[j])))
+                offset += 1
+        elif kind == "OrdinalEncoder":
+            if transformer.handle_unknown != "error":
+                return None
+            for j, column in enumerate(columns):
+                codes = {c: float(k) for k, c in enumerate(transformer.categories_[j].tolist())}
+                ordinal.append((column, offset, codes))
+                offset += 1
+        else:
+            return None
+    
+    if offset != booster.num_feature():
+        return None
+    return _FeaturePlan(booster, offset, tuple(onehot), tuple(numeric), tuple(ordinal))
+
+
 # ============================================================================
 # EPC Mapping Tables
 # ============================================================================
@@ -268,10 +351,13 @@ PROPERTY_TYPE_MAP = {
 }
 
 
+@lru_cache(maxsize=16)
 def _map_property_type(property_type: PropertyType) -> str:
     """
     Map English property type label to Greek label expected by the model.
     
+    Cached per enum member (9 values), so repeated requests skip the lookup.
+    
     Args:
         property_type: PropertyType enum value
         
@@ -415,12 +501,14 @@ def resolve_epc_from_consumption(
 # Input Data Preparation
 # ============================================================================
 
-def _build_input_dataframe(
+def _input_features(
     request: ARVRequest,
     greek_epc_class: str,
-) -> pd.DataFrame:
+    building_age: int,
+    property_type_greek: str,
+) -> dict[str, Any]:
     """
-    Build a single-row DataFrame with features expected by the trained model.
+    Collect the raw (unencoded) model features for one prediction.
     
     The model expects these columns:
     - Numeric: floor_area, building_age, floor_number, lat, lng, number_of_floors
@@ -430,27 +518,70 @@ def _build_input_dataframe(
     Args:
         request: ARVRequest with property characteristics
         greek_epc_class: Resolved Greek EPC class from the EPC resolution chain
+        building_age: Age of the building in years at prediction time
+        property_type_greek: Greek property type label (from _map_property_type)
+        
+    Returns:
+        Dict of feature name -> scalar value
+    """
+    return {
+        "floor_area":             request.floor_area,
+        "building_age":           building_age,
+        "floor_number":           request.floor_number,
+        "lat":                    request.lat,
+        "lng":                    request.lng,
+        "number_of_floors":       request.number_of_floors,
+        "energy_class":           greek_epc_class,
+        "type":                   property_type_greek,
+        "renovated_last_5_years": request.renovated_last_5_years,
+    }
+
+
+def _build_input_dataframe(features: dict[str, Any]) -> pd.DataFrame:
+    """
+    Build a single-row DataFrame for model.predict() (generic pipeline path).
+    
+    Args:
+        features: Raw features from _input_features
         
     Returns:
         Single-row DataFrame ready for model.predict()
     """
-    current_year = datetime.now().year
-    building_age = current_year - request.construction_year
-    property_type_greek = _map_property_type(request.property_type)
+    return pd.DataFrame({name: [value] for name, value in features.items()})
+
+
+def _build_input_row(plan: _FeaturePlan, features: dict[str, Any]) -> np.ndarray:
+    """
+    Encode raw features into the (1, n_features) row the booster expects.
     
-    data = {
-        "floor_area":             [request.floor_area],
-        "building_age":           [building_age],
-        "floor_number":           [request.floor_number],
-        "lat":                    [request.lat],
-        "lng":                    [request.lng],
-        "number_of_floors":       [request.number_of_floors],
-        "energy_class":           [greek_epc_class],
-        "type":                   [property_type_greek],
-        "renovated_last_5_years": [request.renovated_last_5_years],
-    }
+    Mirrors the fitted ColumnTransformer: one-hot columns are 1.0 for known,
+    non-dropped categories (unknown categories stay all-zero), numeric columns
+    are standardised, and ordinal columns take their category code.
     
-    return pd.DataFrame(data)
+    Args:
+        plan: Compiled feature plan from _compile_feature_plan
+        features: Raw features from _input_features
+        
+    Returns:
+        Float64 array of shape (1, plan.n_features)
+        
+    Raises:
+        ValueError: If an ordinal feature has a category unseen during training
+    """
+    row = np.zeros((1, plan.n_features), dtype=np.float64)
+    for column, index in plan.onehot:
+        i = index.get(features[column])
+        if i is not None:
+            row[0, i] = 1.0
+    for column, i, mean, scale in plan.numeric:
+        value = features[column]
+        row[0, i] = np.nan if value is None else (value - mean) / scale
+    for column, i, codes in plan.ordinal:
+        code = codes.get(features[column])
+        if code is None:
+            raise ValueError(f"Unknown {column} category: {features[column]!r}")
+        row[0, i] = code
+    return row
 
 
 # ============================================================================
@@ -485,19 +616,34 @@ async def predict_arv(request: ARVRequest) -> ARVResponse:
     # ─────────────────────────────────────────────────────────────
 
     try:
-        model = _load_model()
+        model = load_model()
     except Exception as e:
         raise RuntimeError(f"Model loading failed: {e}")
 
+    # Request-level inputs shared by both snapshots and the metadata
+    now = datetime.now()
+    building_age = now.year - request.construction_year
+    property_type_greek = _map_property_type(request.property_type)
+
     # ─────────────────────────────────────────────────────────────
-    # Step 2: Helper — run one prediction for a given consumption value
+    # Step 2: Helpers — batch prediction and snapshot construction
     # ─────────────────────────────────────────────────────────────
 
-    def _predict_snapshot(consumption: float) -> ARVValueSnapshot:
-        epc = resolve_epc_from_consumption(request.target_country, consumption)
-        df = _build_input_dataframe(request, epc["greek_epc_class"])
-        price_per_sqm = float(model.predict(df)[0])
-        return ARVValueSnapshot(
+    def _predict_prices(epcs: list[dict[str, str]]) -> list[float]:
+        rows = [
+            _input_features(request, epc["greek_epc_class"], building_age, property_type_greek)
+            for epc in epcs
+        ]
+        # All snapshots go through the booster in one call; with only one or
+        # two rows, OpenMP thread fan-out costs more than it saves
+        if _FEATURE_PLAN is not None:
+            X = np.vstack([_build_input_row(_FEATURE_PLAN, features) for features in rows])
+            return _FEATURE_PLAN.booster.predict(X, num_threads=1).tolist()
+        df = pd.concat([_build_input_dataframe(features) for features in rows], ignore_index=True)
+        return model.predict(df, num_threads=1).tolist()
+
+    def _snapshot(epc: dict[str, str], price_per_sqm: float) -> ARVValueSnapshot:
+        return ARVValueSnapshot.model_construct(
             price_per_sqm=price_per_sqm,
             total_price=price_per_sqm * request.floor_area,
             greek_epc_class=epc["greek_epc_class"],
@@ -508,18 +654,21 @@ async def predict_arv(request: ARVRequest) -> ARVResponse:
     # Step 3: Compute after (always) and before (if provided)
     # ─────────────────────────────────────────────────────────────
 
+    consumptions = [request.energy_consumption_after]
+    if request.energy_consumption_before is not None:
+        consumptions.append(request.energy_consumption_before)
+
     try:
-        snapshot_after = _predict_snapshot(request.energy_consumption_after)
-        snapshot_before = (
-            _predict_snapshot(request.energy_consumption_before)
-            if request.energy_consumption_before is not None
-            else None
-        )
+        epcs = [resolve_epc_from_consumption(request.target_country, c) for c in consumptions]
+        snapshots = [_snapshot(epc, price) for epc, price in zip(epcs, _predict_prices(epcs))]
     except ValueError:
         raise
     except Exception as e:
         raise RuntimeError(f"Prediction failed: {e}")
 
+    snapshot_after = snapshots[0]
+    snapshot_before = snapshots[1] if len(snapshots) > 1 else None
+
     # ─────────────────────────────────────────────────────────────
     # Step 4: Compute uplift
     # ─────────────────────────────────────────────────────────────
@@ -528,7 +677,7 @@ async def predict_arv(request: ARVRequest) -> ARVResponse:
     if snapshot_before is not None:
         price_increase = snapshot_after.total_price - snapshot_before.total_price
         price_increase_pct = (price_increase / snapshot_before.total_price) * 100
-        uplift = ARVUplift(
+        uplift = ARVUplift.model_construct(
             price_increase=round(price_increase, 2),
             price_increase_pct=round(price_increase_pct, 2),
         )
@@ -537,15 +686,13 @@ async def predict_arv(request: ARVRequest) -> ARVResponse:
     # Step 5: Build metadata
     # ─────────────────────────────────────────────────────────────
 
-    current_year = datetime.now().year
-    building_age = current_year - request.construction_year
     canonical_country = normalize_target_country(request.target_country)
 
-    metadata = {
-        "model_file": "lgb_model_greece.pkl",
-        "prediction_timestamp": datetime.now().isoformat(),
+    metadata = _METADATA_TEMPLATE.copy()
+    metadata.update({
+        "prediction_timestamp": now.isoformat(),
         "building_age": building_age,
-        "property_type_mapped": _map_property_type(request.property_type),
+        "property_type_mapped": property_type_greek,
         "energy_consumption_unit": COUNTRY_SCALE_NOTES.get(canonical_country, "kWh/m²/year"),
         "input_features": {
             "lat":                         request.lat,
@@ -558,9 +705,10 @@ async def predict_arv(request: ARVRequest) -> ARVResponse:
             "energy_consumption_before":   request.energy_consumption_before,
             "renovated_last_5_years":      request.renovated_last_5_years,
         },
-    }
+    })
 
-    return ARVResponse(
+    # All fields are produced above from validated inputs; skip re-validation
+    return ARVResponse.model_construct(
         after=snapshot_after,
         before=snapshot_before,
         uplift=uplift,
@@ -5,23 +5,21 @@ Orchestrates the Monte Carlo simulation for all requested financing schemes
 and builds the response based on the output_level.
 """
 
+import asyncio
+import hashlib
 import math
-import sys
-from pathlib import Path
-from typing import Any, Dict
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
-# Add Indicator Modules to path
-indicator_modules_path = Path(__file__).parent.parent / "Indicator Modules"
-if str(indicator_modules_path) not in sys.path:
-    sys.path.insert(0, str(indicator_modules_path))
+import numpy as np
 
-from simulation_engine import (
+from ..data.lookup import compute_capex, compute_opex
+from ..indicator_modules.simulation_engine import (
     SchemeConfigurationError,
     FinancialSimulationError,
     get_kpi_results,
 )
-
-from ..data.lookup import compute_capex, compute_opex
 from ..models.risk_assessment import (
     OutputLevel,
     RiskAssessmentRequest,
@@ -29,16 +27,88 @@ from ..models.risk_assessment import (
 )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Result cache
+# ─────────────────────────────────────────────────────────────────────────────
+# The simulation is deterministic (fixed seed), so identical project/scheme
+# inputs always produce identical raw results. Retries and output-level
+# switches within the TTL reuse them instead of re-running 10k scenarios.
+
+_RESULT_CACHE_TTL_S = 60.0
+_RESULT_CACHE_MAXSIZE = 1024
+
+# Fields that only shape the response, not the simulation
+_OUTPUT_ONLY_FIELDS = frozenset({"output_level", "indicators", "include_visualizations"})
+
+# key -> (expires_at, (capex, opex, raw_results))
+_result_cache: "OrderedDict[bytes, Tuple[float, Tuple[float, float, Dict[str, Any]]]]" = OrderedDict()
+
+
+def _result_cache_key(request: RiskAssessmentRequest) -> bytes:
+    """Hash the simulation-relevant part of the request body."""
+    payload = request.model_dump_json(exclude=set(_OUTPUT_ONLY_FIELDS))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _result_cache_get(key: bytes) -> Optional[Tuple[float, float, Dict[str, Any]]]:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    return value
+
+
+def _freeze_arrays(value: Any) -> None:
+    """Mark every ndarray in a cached result read-only so no caller can mutate shared state."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze_arrays(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _freeze_arrays(v)
+
+
+def _result_cache_put(key: bytes, value: Tuple[float, float, Dict[str, Any]]) -> None:
+    _freeze_arrays(value)
+    _result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL_S, value)
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > _RESULT_CACHE_MAXSIZE:
+        _result_cache.popitem(last=False)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _sanitize_for_json(value: Any) -> Any:
     """Recursively replace NaN/Inf values with None for safe JSON serialisation."""
-    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
-        return None
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, np.ndarray):
+        # A finite sum proves every element is finite (any NaN/Inf poisons it);
+        # only arrays that fail it pay for the element-wise mask
+        if value.dtype.kind == "f" and not math.isfinite(value.sum()):
+            finite = np.isfinite(value)
+            if not finite.all():
+                return np.where(finite, value, None).tolist()
+        return value.tolist()
     if isinstance(value, dict):
         return {k: _sanitize_for_json(v) for k, v in value.items()}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # NamedTuple rows (e.g. Percentiles) keep their type for the response serializer.
+        # They are immutable, so an all-finite numeric row is returned as-is
+        try:
+            if all(map(math.isfinite, value)):
+                return value
+        except TypeError:
+            pass
+        return type(value)(*(_sanitize_for_json(v) for v in value))
     if isinstance(value, (list, tuple)):
         return [_sanitize_for_json(v) for v in value]
     return value
@@ -77,7 +147,8 @@ async def perform_risk_assessment(request: RiskAssessmentRequest) -> RiskAssessm
 
     Steps:
     1. Convert Pydantic scheme models to (scheme_type, details) tuples.
-    2. Run get_kpi_results() for all schemes in a single simulation pass.
+    2. Run get_kpi_results() for all schemes in a single simulation pass on a
+       worker thread (or reuse a cached run for an identical request within the TTL).
     3. Filter the raw output based on output_level.
     4. Return a structured RiskAssessmentResponse.
 
@@ -88,57 +159,73 @@ async def perform_risk_assessment(request: RiskAssessmentRequest) -> RiskAssessm
     RuntimeError
         If the Monte Carlo simulation itself fails.
     """
-    # ── Resolve CAPEX / OPEX (lookup if not explicitly provided) ───────────────
     capex_from_lookup = request.capex is None
     opex_from_lookup = request.annual_maintenance_cost is None
 
-    if capex_from_lookup:
-        capex = compute_capex(request.country, request.renovation_actions)
-    else:
-        capex = request.capex
+    cache_key = _result_cache_key(request)
+    cached = _result_cache_get(cache_key)
 
-    if opex_from_lookup:
-        opex = compute_opex(request.country, request.renovation_actions)
+    if cached is not None:
+        capex, opex, raw_results = cached
     else:
-        opex = request.annual_maintenance_cost if request.annual_maintenance_cost is not None else 0.0
-
-    # ── Convert scheme models to engine tuples ────────────────────────────────
-    schemes = []
-    for s in request.schemes:
-        details = s.model_dump(exclude={"scheme_type", "scheme_family"})
-        schemes.append((s.scheme_type, details))
-
-    # ── Run simulation ────────────────────────────────────────────────────────
-    try:
-        raw_results = get_kpi_results(
-            capex=capex,
-            annual_energy_savings=request.annual_energy_savings,
-            annual_maintenace_cost=opex,
-            project_lifetime=request.project_lifetime,
-            schemes=schemes,
-            n_sims=10000,
-            seed=42,
-        )
-    except SchemeConfigurationError as exc:
-        raise ValueError(str(exc)) from exc
-    except FinancialSimulationError as exc:
-        raise RuntimeError(str(exc)) from exc
-    except Exception as exc:
-        raise RuntimeError(f"Simulation failed: {exc}") from exc
+        # ── Resolve CAPEX / OPEX (lookup if not explicitly provided) ───────────
+        if capex_from_lookup:
+            capex = compute_capex(request.country, request.renovation_actions)
+        else:
+            capex = request.capex
+
+        if opex_from_lookup:
+            opex = compute_opex(request.country, request.renovation_actions)
+        else:
+            opex = request.annual_maintenance_cost if request.annual_maintenance_cost is not None else 0.0
+
+        # ── Convert scheme models to engine tuples ────────────────────────────
+        schemes = []
+        for s in request.schemes:
+            details = s.model_dump(exclude={"scheme_type", "scheme_family"})
+            schemes.append((s.scheme_type, details))
+
+        # ── Run simulation ────────────────────────────────────────────────────
+        # CPU-bound; run it on a worker thread so the event loop keeps serving
+        # other requests (health checks, cache hits) meanwhile
+        try:
+            raw_results = await asyncio.to_thread(
+                get_kpi_results,
+                capex=capex,
+                annual_energy_savings=request.annual_energy_savings,
+                annual_maintenace_cost=opex,
+                project_lifetime=request.project_lifetime,
+                schemes=schemes,
+                n_sims=10000,
+                seed=42,
+            )
+        except SchemeConfigurationError as exc:
+            raise ValueError(str(exc)) from exc
+        except FinancialSimulationError as exc:
+            raise RuntimeError(str(exc)) from exc
+        except Exception as exc:
+            raise RuntimeError(f"Simulation failed: {exc}") from exc
+
+        _result_cache_put(cache_key, (capex, opex, raw_results))
 
     # ── Build filtered output per scheme ─────────────────────────────────────
+    # KPI percentiles to keep, resolved once for all schemes. Always keep
+    # total_repayment if present (useful for debt schemes)
+    keep = frozenset(request.indicators) | {"total_repayment"}
+
     results: Dict[str, Any] = {}
     for scheme_type, data in raw_results.items():
         filtered = _filter_by_output_level(data, request.output_level)
 
-        # Restrict KPI percentiles to requested indicators
+        # Restrict KPI percentiles to requested indicators (copy the summary
+        # so the cached raw results stay intact for other indicator sets)
         if "summary" in filtered and "percentiles" in filtered["summary"]:
-            requested = set(request.indicators)
-            # Always keep total_repayment if present (useful for debt schemes)
-            keep = requested | {"total_repayment"}
-            filtered["summary"]["percentiles"] = {
-                k: v for k, v in filtered["summary"]["percentiles"].items()
-                if k in keep
+            filtered["summary"] = {
+                **filtered["summary"],
+                "percentiles": {
+                    k: v for k, v in filtered["summary"]["percentiles"].items()
+                    if k in keep
+                },
             }
 
         results[scheme_type] = _sanitize_for_json(filtered)
@@ -5,17 +5,13 @@ This tests the complete private output flow including the
 annual cash flow chart generation.
 """
 
+import base64
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-# Add Indicator Modules to path
-indicator_modules_path = Path(__file__).parent.parent.parent.parent / "Indicator Modules"
-if str(indicator_modules_path) not in sys.path:
-    sys.path.insert(0, str(indicator_modules_path))
-
 from src.relife_financial.models.risk_assessment import (
     RiskAssessmentRequest,
     OutputLevel
@@ -23,6 +19,18 @@ from src.relife_financial.models.risk_assessment import (
 from src.relife_financial.services.risk_assessment import perform_risk_assessment
 
 
+_PNG_DATA_URI_PREFIX = "data:image/png;base64,"
+
+
+def _save_png(viz_data: str, output_path: Path) -> bool:
+    """Decode a PNG data URI to disk; False if it is not one."""
+    if not viz_data.startswith(_PNG_DATA_URI_PREFIX):
+        return False
+    with open(output_path, "wb") as f:
+        f.write(base64.b64decode(viz_data[len(_PNG_DATA_URI_PREFIX):]))
+    return True
+
+
 async def test_private_output_with_loan():
     """Test private output with loan scenario."""
     
@@ -84,22 +92,16 @@ async def test_private_output_with_loan():
                 print(f"  {key}: {size_kb:.1f} KB")
                 
                 # Save to file for inspection
-                if viz_data.startswith("data:image/png;base64,"):
-                    import base64
-                    img_data = viz_data.split(",")[1]
-                    output_path = Path(__file__).parent / f"test_{key}.png"
-                    with open(output_path, "wb") as f:
-                        f.write(base64.b64decode(img_data))
+                output_path = Path(__file__).parent / f"test_{key}.png"
+                if _save_png(viz_data, output_path):
                     print(f"    Saved to: {output_path}")
             else:
                 print(f"  {key}: Not generated")
     else:
         print("  No visualizations included")
     
-    # Calculate response size
-    import json
-    response_json = response.model_dump_json()
-    response_size_kb = len(response_json) / 1024
+    # Calculate response size (UTF-8 bytes straight from pydantic-core, no str decode)
+    response_size_kb = len(response.__pydantic_serializer__.to_json(response)) / 1024
     print(f"\n📦 Total Response Size: {response_size_kb:.1f} KB")
     
     if response_size_kb > 10:
@@ -162,12 +164,8 @@ async def test_private_output_no_loan():
                 print(f"  {key}: {size_kb:.1f} KB")
                 
                 # Save to file for inspection
-                if viz_data.startswith("data:image/png;base64,"):
-                    import base64
-                    img_data = viz_data.split(",")[1]
-                    output_path = Path(__file__).parent / f"test_no_loan_{key}.png"
-                    with open(output_path, "wb") as f:
-                        f.write(base64.b64decode(img_data))
+                output_path = Path(__file__).parent / f"test_no_loan_{key}.png"
+                if _save_png(viz_data, output_path):
                     print(f"    Saved to: {output_path}")
     
     print("\n" + "=" * 80)
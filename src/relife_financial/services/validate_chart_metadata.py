@@ -19,6 +19,22 @@ from src.relife_financial.models.risk_assessment import (
 from src.relife_financial.services.risk_assessment import perform_risk_assessment
 
 
+# Required fields from the visualization function (order = error report order)
+_REQUIRED_FIELDS = (
+    "years",
+    "initial_investment",
+    "annual_inflows",
+    "annual_outflows",
+    "annual_net_cash_flow",
+    "cumulative_cash_flow",
+    "breakeven_year",
+    "loan_term",
+)
+
+# Per-year arrays: Year 0 + operational years
+_YEARLY_FIELDS = ("years", "annual_inflows", "annual_outflows", "annual_net_cash_flow", "cumulative_cash_flow")
+
+
 def validate_cash_flow_metadata(viz_data: dict, request: RiskAssessmentRequest) -> dict:
     """
     Validate cash flow metadata against requirements.
@@ -29,22 +45,8 @@ def validate_cash_flow_metadata(viz_data: dict, request: RiskAssessmentRequest)
     errors = []
     warnings = []
     
-    # Required fields from the visualization function
-    required_fields = [
-        "years",
-        "initial_investment",
-        "annual_inflows",
-        "annual_outflows",
-        "annual_net_cash_flow",
-        "cumulative_cash_flow",
-        "breakeven_year",
-        "loan_term"
-    ]
-    
     # Check all required fields exist
-    for field in required_fields:
-        if field not in viz_data:
-            errors.append(f"Missing required field: '{field}'")
+    errors.extend(f"Missing required field: '{field}'" for field in _REQUIRED_FIELDS if field not in viz_data)
     
     if errors:
         return {"valid": False, "errors": errors, "warnings": warnings}
@@ -52,7 +54,7 @@ def validate_cash_flow_metadata(viz_data: dict, request: RiskAssessmentRequest)
     # Validate array lengths
     expected_length = request.project_lifetime + 1  # Year 0 + operational years
     
-    for field in ["years", "annual_inflows", "annual_outflows", "annual_net_cash_flow", "cumulative_cash_flow"]:
+    for field in _YEARLY_FIELDS:
         if len(viz_data[field]) != expected_length:
             errors.append(
                 f"'{field}' has wrong length: {len(viz_data[field])} (expected {expected_length})"
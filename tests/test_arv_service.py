@@ -0,0 +1,109 @@
+"""
+Tests for the ARV service prediction path.
+
+The service encodes each request straight into the booster's feature row
+instead of going through the sklearn pipeline; these tests pin that fast path
+to the pipeline's own predictions.
+"""
+
+import pytest
+
+from relife_financial.models.arv import ARVRequest, PropertyType
+from relife_financial.services import arv as arv_service
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = arv_service.load_model()
+    assert arv_service._FEATURE_PLAN is not None
+    return model
+
+
+def _request(**overrides) -> ARVRequest:
+    payload = {
+        "lat": 37.98,
+        "lng": 23.72,
+        "floor_area": 85,
+        "construction_year": 1985,
+        "floor_number": 2,
+        "number_of_floors": 5,
+        "property_type": "Apartment",
+        "target_country": "Greece",
+        "energy_consumption_after": 85,
+        "renovated_last_5_years": False,
+    }
+    payload.update(overrides)
+    return ARVRequest(**payload)
+
+
+@pytest.mark.parametrize("property_type", list(PropertyType))
+@pytest.mark.parametrize("greek_epc_class", sorted(set(arv_service.ENERGY_CLASS_MAP_ITALY_TO_GREECE.values())))
+def test_feature_row_matches_pipeline(model, property_type, greek_epc_class):
+    request = _request(property_type=property_type, renovated_last_5_years=True)
+    features = arv_service._input_features(
+        request, greek_epc_class, 41, arv_service._map_property_type(property_type)
+    )
+
+    plan = arv_service._FEATURE_PLAN
+    fast = plan.booster.predict(arv_service._build_input_row(plan, features))[0]
+    reference = model.predict(arv_service._build_input_dataframe(features))[0]
+
+    assert fast == reference
+
+
+def test_feature_row_handles_missing_floor_number(model):
+    request = _request(property_type="Detached House", floor_number=None, number_of_floors=2)
+    features = arv_service._input_features(request, "Γ", 60, "Μονοκατοικία")
+
+    plan = arv_service._FEATURE_PLAN
+    fast = plan.booster.predict(arv_service._build_input_row(plan, features))[0]
+    reference = model.predict(arv_service._build_input_dataframe(features))[0]
+
+    assert fast == reference
+
+
+def _toy_pipeline(scaler, encoder):
+    import numpy as np
+    import pandas as pd
+    from lightgbm import LGBMRegressor
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        "area": rng.uniform(40, 200, 200),
+        "kind": rng.choice(["a", "b", "c"], 200),
+    })
+    y = X["area"] * 10 + (X["kind"] == "b") * 500
+    pipeline = Pipeline([
+        ("preprocessor", ColumnTransformer(
+            [("num", scaler, ["area"]), ("cat", encoder, ["kind"])],
+            sparse_threshold=0,
+        )),
+        ("regressor", LGBMRegressor(n_estimators=20, min_child_samples=5, verbose=-1)),
+    ])
+    return pipeline.fit(X, y)
+
+
+@pytest.mark.parametrize("with_mean, with_std", [(True, True), (False, True), (True, False), (False, False)])
+def test_feature_plan_honours_scaler_configuration(with_mean, with_std):
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    model = _toy_pipeline(
+        StandardScaler(with_mean=with_mean, with_std=with_std),
+        OneHotEncoder(handle_unknown="ignore"),
+    )
+    plan = arv_service._compile_feature_plan(model)
+    assert plan is not None
+
+    for features in ({"area": 55.0, "kind": "a"}, {"area": 180.0, "kind": "b"}, {"area": 90.0, "kind": "z"}):
+        fast = plan.booster.predict(arv_service._build_input_row(plan, features))[0]
+        reference = model.predict(arv_service._build_input_dataframe(features))[0]
+        assert fast == reference
+
+
+def test_feature_plan_falls_back_for_infrequent_categories():
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    model = _toy_pipeline(StandardScaler(), OneHotEncoder(handle_unknown="ignore", min_frequency=5))
+    assert arv_service._compile_feature_plan(model) is None
@@ -0,0 +1,112 @@
+"""
+Tests for the risk-assessment service layer and response model.
+
+Runs the real Monte Carlo engine on a small equity-only request.
+"""
+import numpy as np
+import pytest
+
+from relife_financial.indicator_modules.simulation_engine import Percentiles
+from relife_financial.models.risk_assessment import RiskAssessmentRequest
+from relife_financial.services import risk_assessment as ra_service
+from relife_financial.services.risk_assessment import perform_risk_assessment
+
+
+PERCENTILE_KEYS = ["P5", "P10", "P25", "P50", "P75", "P90", "P95"]
+
+
+def _request(**overrides) -> RiskAssessmentRequest:
+    payload = {
+        "capex": 60000,
+        "annual_energy_savings": 27400,
+        "annual_maintenance_cost": 2000,
+        "project_lifetime": 15,
+        "output_level": "private",
+        "schemes": [{"scheme_type": "equity"}],
+        "indicators": ["NPV", "IRR", "PBP"],
+    }
+    payload.update(overrides)
+    return RiskAssessmentRequest.model_validate(payload)
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    ra_service._result_cache.clear()
+    yield
+    ra_service._result_cache.clear()
+
+
+async def test_percentiles_serialise_as_keyed_objects():
+    response = await perform_risk_assessment(_request())
+
+    percentiles = response.model_dump(mode="json")["results"]["equity"]["summary"]["percentiles"]
+    assert set(percentiles) == {"NPV", "IRR", "PBP", "total_repayment"}
+    for row in percentiles.values():
+        assert list(row) == PERCENTILE_KEYS
+
+
+async def test_percentile_rows_are_ordered():
+    response = await perform_risk_assessment(_request())
+
+    npv = response.results["equity"]["summary"]["percentiles"]["NPV"]
+    assert npv.P5 <= npv.P50 <= npv.P95
+    assert list(npv._asdict()) == PERCENTILE_KEYS
+
+
+async def test_identical_request_reuses_cached_simulation(monkeypatch):
+    calls = []
+    real_get_kpi_results = ra_service.get_kpi_results
+
+    def counting_get_kpi_results(**kwargs):
+        calls.append(kwargs)
+        return real_get_kpi_results(**kwargs)
+
+    monkeypatch.setattr(ra_service, "get_kpi_results", counting_get_kpi_results)
+
+    first = await perform_risk_assessment(_request())
+    second = await perform_risk_assessment(_request(output_level="professional"))
+
+    assert len(calls) == 1
+    assert "kpi_histograms" not in first.results["equity"]
+    assert "kpi_histograms" in second.results["equity"]
+
+
+async def test_cached_results_respect_requested_indicators():
+    narrow = await perform_risk_assessment(_request(indicators=["NPV"]))
+    wide = await perform_risk_assessment(_request(indicators=["NPV", "IRR", "ROI"]))
+
+    assert set(narrow.results["equity"]["summary"]["percentiles"]) == {"NPV", "total_repayment"}
+    assert set(wide.results["equity"]["summary"]["percentiles"]) == {"NPV", "IRR", "ROI", "total_repayment"}
+
+
+def test_sanitize_converts_arrays_and_nulls_non_finite():
+    sanitized = ra_service._sanitize_for_json({
+        "edges": np.array([0.0, np.nan, np.inf, 2.5]),
+        "counts": np.array([3, 4]),
+    })
+
+    assert sanitized == {"edges": [0.0, None, None, 2.5], "counts": [3, 4]}
+    assert all(type(v) is float for v in (sanitized["edges"][0], sanitized["edges"][3]))
+
+
+async def test_cached_result_arrays_are_read_only():
+    await perform_risk_assessment(_request(output_level="professional"))
+
+    (_, (_, _, raw_results)), = ra_service._result_cache.values()
+    edges = raw_results["equity"]["kpi_histograms"]["NPV"]["bin_edges"]
+    with pytest.raises(ValueError):
+        edges[0] = 0.0
+
+
+def test_sanitize_percentile_rows():
+    finite = Percentiles(1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
+    with_nan = finite._replace(P5=float("nan"), P95=float("inf"))
+
+    assert ra_service._sanitize_for_json(finite) is finite
+    sanitized = ra_service._sanitize_for_json(with_nan)
+    assert type(sanitized) is Percentiles
+    assert sanitized == (None, 2.0, 3.0, 4.0, 5.0, 6.0, None)
+
+    # -inf and +inf together make math.fsum raise ValueError; still sanitized
+    both_inf = finite._replace(P5=float("-inf"), P95=float("inf"))
+    assert ra_service._sanitize_for_json(both_inf) == (None, 2.0, 3.0, 4.0, 5.0, 6.0, None)
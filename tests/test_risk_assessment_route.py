@@ -0,0 +1,77 @@
+"""
+Regression test for POST /risk-assessment.
+
+The route returns the response pre-serialised by pydantic-core; pins that the
+body still matches RiskAssessmentResponse and that non-finite floats become null,
+and that large bodies are gzip-compressed for clients that accept it.
+
+The service layer is monkeypatched so the test runs without the Monte Carlo engine.
+"""
+
+from fastapi.testclient import TestClient
+
+from relife_financial.app import app
+from relife_financial.models.risk_assessment import RiskAssessmentResponse
+from relife_financial.routes import risk_assessment as risk_assessment_route
+
+
+client = TestClient(app)
+
+
+VALID_PAYLOAD = {
+    "capex": 60000,
+    "annual_energy_savings": 27400,
+    "annual_maintenance_cost": 2000,
+    "project_lifetime": 15,
+    "output_level": "private",
+    "schemes": [{"scheme_type": "equity"}],
+    "indicators": ["NPV", "IRR"],
+}
+
+
+def test_post_risk_assessment_returns_json_with_null_for_non_finite(monkeypatch):
+    async def fake_perform_risk_assessment(request):
+        return RiskAssessmentResponse(
+            results={"equity": {"scheme_id": "equity", "irr": float("nan"), "npv": [1.5, float("inf")]}},
+            metadata={"n_sims": 10000},
+        )
+
+    monkeypatch.setattr(risk_assessment_route, "perform_risk_assessment", fake_perform_risk_assessment)
+
+    response = client.post("/risk-assessment", json=VALID_PAYLOAD)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "results": {"equity": {"scheme_id": "equity", "irr": None, "npv": [1.5, None]}},
+        "metadata": {"n_sims": 10000},
+    }
+
+
+def _patch_response(monkeypatch, results):
+    async def fake_perform_risk_assessment(request):
+        return RiskAssessmentResponse(results=results, metadata={"n_sims": 10000})
+
+    monkeypatch.setattr(risk_assessment_route, "perform_risk_assessment", fake_perform_risk_assessment)
+
+
+def test_post_risk_assessment_gzips_large_response(monkeypatch):
+    path = [float(i) + 0.125 for i in range(500)]
+    results = {"equity": {"scheme_id": "equity", "cashflow_distributions": {"P50": path}}}
+    _patch_response(monkeypatch, results)
+
+    response = client.post("/risk-assessment", json=VALID_PAYLOAD, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["results"] == results
+
+
+def test_post_risk_assessment_small_response_is_not_gzipped(monkeypatch):
+    _patch_response(monkeypatch, {"equity": {"scheme_id": "equity"}})
+
+    response = client.post("/risk-assessment", json=VALID_PAYLOAD, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200, response.text
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,35 @@
+"""
+Tests for the Monte Carlo engine's scenario-block KPIs.
+
+get_kpi_results computes PBP, DPP and ROI for all scenarios of a scheme at
+once; these tests pin the array forms to the scalar KPI functions row by row.
+"""
+
+import numpy as np
+import pytest
+
+from relife_financial.indicator_modules import simulation_engine as se
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (np.isnan(a) and np.isnan(b))
+
+
+@pytest.mark.parametrize("T", [1, 5, 20, 120])
+def test_block_kpis_match_scalar_functions(T):
+    rng = np.random.default_rng(T)
+    n = 500
+    paths = rng.normal(3000, 4000, (n, T + 1))
+    paths[:, 0] = rng.normal(-20000, 15000, n)
+    paths[::25, 0] = 0.0
+    d_r = rng.uniform(-0.2, 0.2, n)
+
+    pbp = se._pbp_over_sims(paths)
+    dpp = se._dpp_over_sims(d_r, paths)
+    roi = se._roi_over_sims(paths)
+
+    for i in range(n):
+        flows = paths[i].tolist()
+        assert _same(pbp[i], se.PBP(flows))
+        assert _same(dpp[i], se.DPP(float(d_r[i]), T, flows))
+        assert _same(roi[i], se.ROI(flows))
@@ -8,7 +8,6 @@ import asyncio
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "relife_financial" / "Indicator Modules"))
 
 from relife_financial.models.risk_assessment import RiskAssessmentRequest
 from relife_financial.services.risk_assessment import perform_risk_assessment
@@ -60,7 +59,11 @@ private_resp, prof_resp = asyncio.run(run())
 # ══════════════════════════════════════════════════════════════════
 # PRIVATE — bar chart data
 # ══════════════════════════════════════════════════════════════════
-eq = private_resp.results["equity"]
+# Inspect the serialised (wire) form — this is what the frontend receives.
+private_results = private_resp.model_dump(mode="json")["results"]
+prof_results = prof_resp.model_dump(mode="json")["results"]
+
+eq = private_results["equity"]
 cf = eq["cashflow_distributions"]
 summary = eq["summary"]
 
@@ -98,7 +101,7 @@ check("private: scheme_id present", "scheme_id" in eq)
 # ══════════════════════════════════════════════════════════════════
 # PROFESSIONAL — fan chart (all 5 percentile bands)
 # ══════════════════════════════════════════════════════════════════
-eq_p = prof_resp.results["equity"]
+eq_p = prof_results["equity"]
 cf_p = eq_p["cashflow_distributions"]
 
 for band in ["P5", "P10", "P50", "P90", "P95"]:
@@ -159,9 +162,9 @@ check("prof: disc_target_used > 0",
       and eq_p["summary"]["disc_target_used"] > 0)
 
 # PROFESSIONAL — multi-scheme comparison
-check("prof: 3 schemes returned", len(prof_resp.results) == 3)
+check("prof: 3 schemes returned", len(prof_results) == 3)
 for st in ["equity", "bank_loan", "epc_shared_savings"]:
-    check(f"prof: scheme {st} present", st in prof_resp.results)
+    check(f"prof: scheme {st} present", st in prof_results)
 
 # scheme_family for colour coding
 expected_families = {
@@ -170,13 +173,13 @@ expected_families = {
     "epc_shared_savings": "esco_zero_capex",
 }
 for st, expected in expected_families.items():
-    actual = prof_resp.results.get(st, {}).get("scheme_family")
+    actual = prof_results.get(st, {}).get("scheme_family")
     check(f"prof: {st} scheme_family == {expected}", actual == expected, f"got {actual!r}")
 
 # All 3 schemes have histograms and fan chart
 for st in ["equity", "bank_loan", "epc_shared_savings"]:
-    if st in prof_resp.results:
-        s = prof_resp.results[st]
+    if st in prof_results:
+        s = prof_results[st]
         check(f"prof: {st} has kpi_histograms", "kpi_histograms" in s)
         check(f"prof: {st} has all 5 cf bands",
               all(b in s["cashflow_distributions"]["cash_flows"] for b in ["P5","P10","P50","P90","P95"]))